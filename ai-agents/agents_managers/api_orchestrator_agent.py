@@ -6,71 +6,182 @@ discovery and content extraction tasks across multiple specialized agents.
 Includes tools for chunking and coordinating parallel extraction.
 """
 
-from crewai import Agent, LLM
+from crewai import Agent
 from crewai.tools import tool
-from core.agent_managers_config_loader import AgentConfigLoader
+from core.agent_managers_config_loader import get_agent_cfg
+from core.json_utils import loads, dumps
+from core.llm_factory import build_llm, warm_up_llm
 from dotenv import load_dotenv
+import heapq
 import os
-import json
-from typing import List, Dict, Any
+import threading
+import uuid
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+
+try:
+    import diskcache
+except ImportError:  # chunking results are simply not memoized
+    diskcache = None
+
+try:
+    from blake3 import blake3 as _content_hash
+except ImportError:
+    from hashlib import blake2b as _content_hash
+
+# On-disk memo of chunk_discovery_results output, keyed by a hash of the payload.
+# Opt-in: only used when MCPEA_CACHE_DIR is set (stored under <dir>/chunker)
+_CHUNK_CACHE_TTL = 86400
+# Part of every cache key; bump whenever _chunk_discovery_data changes how it
+# splits endpoints, so chunk lists cached by an older version are not served
+_CHUNKER_VERSION = 4
+_chunk_cache = None
+
+# Chunk lists produced by chunk_discovery_results, keyed by the handle handed to the
+# LLM, so coordinate_extraction can pick them up without a JSON round trip. Each
+# entry is removed when coordinate_extraction consumes it; handles that are never
+# consumed are evicted oldest first beyond _MAX_STAGED_CHUNKS, after which
+# coordinate_extraction reports the evicted handle as unknown or expired.
+_STAGING_PREFIX = "staging:"
+_MAX_STAGED_CHUNKS = 32
+_STAGED_CHUNKS: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+_STAGED_CHUNKS_LOCK = threading.Lock()
+
+
+def _chunk_by_weight(hostname: str, entries: List[Dict[str, Any]], weights: List[float], num_chunks: int) -> List[Dict[str, Any]]:
+    """
+    Partition endpoint entries into chunks of similar total weight.
+    
+    Uses the greedy LPT (longest processing time) heuristic: entries are taken
+    heaviest first and each is assigned to the currently lightest chunk.
+    
+    Returns:
+        Non-empty chunks ordered from heaviest to lightest load
+    """
+    chunks = [{'hostname': hostname, 'endpoints': []} for _ in range(num_chunks)]
+    heap = [(0, chunk_idx) for chunk_idx in range(num_chunks)]
+    
+    for idx in sorted(range(len(entries)), key=weights.__getitem__, reverse=True):
+        load, chunk_idx = heapq.heappop(heap)
+        chunks[chunk_idx]['endpoints'].append(entries[idx])
+        heapq.heappush(heap, (load + weights[idx], chunk_idx))
+    
+    return [chunks[chunk_idx] for _, chunk_idx in sorted(heap, reverse=True) if chunks[chunk_idx]['endpoints']]
+
+
+def _is_weight(value: Any) -> bool:
+    """Whether an endpoint 'size' hint is usable as a balancing weight."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0
+
+
+def _chunk_discovery_data(data: Dict[str, Any], num_chunks: int) -> List[Dict[str, Any]]:
+    """
+    Split parsed discovery results into chunks for parallel extraction.
+    
+    When every endpoint carries a numeric, non-negative 'size' hint (e.g. content
+    length), chunks are balanced by total size instead of endpoint count. Any
+    missing or non-numeric hint falls back to the equal-count split.
+    
+    Returns:
+        List of chunk dictionaries with endpoint data
+    """
+    if not data or 'ocs' not in data:
+        return []
+    
+    num_chunks = max(1, num_chunks)
+    categories = data['ocs']
+    hostname = data.get('hostname', '')
+    
+    entries = [
+        {'category': category.get('name', ''), 'endpoint': endpoint}
+        for category in categories
+        for endpoint in category.get('ces', [])
+    ]
+    
+    # Trivial splits need neither weights nor boundary bookkeeping
+    if len(entries) <= num_chunks:
+        return [{'hostname': hostname, 'endpoints': [entry]} for entry in entries]
+    if num_chunks == 1:
+        return [{'hostname': hostname, 'endpoints': entries}]
+    
+    weights = [
+        entry['endpoint'].get('size') if isinstance(entry['endpoint'], dict) else None
+        for entry in entries
+    ]
+    if all(_is_weight(weight) for weight in weights):
+        return _chunk_by_weight(hostname, entries, weights, num_chunks)
+    
+    # Calculate endpoints per chunk; the last chunk takes the remainder
+    total_endpoints = len(entries)
+    endpoints_per_chunk = max(1, total_endpoints // num_chunks)
+    
+    starts = range(0, total_endpoints, endpoints_per_chunk)[:num_chunks]
+    ends = list(starts[1:]) + [total_endpoints]
+    
+    return [
+        {'hostname': hostname, 'endpoints': entries[start:end]}
+        for start, end in zip(starts, ends)
+    ]
+
+
+def _get_chunk_cache() -> Optional["diskcache.Cache"]:
+    """Open the on-disk chunk cache on first use.
+
+    Returns None, so chunking runs uncached, unless MCPEA_CACHE_DIR is set and
+    diskcache is installed, or if the cache cannot be opened.
+    """
+    global _chunk_cache
+    cache_dir = os.getenv('MCPEA_CACHE_DIR')
+    if _chunk_cache is None and diskcache is not None and cache_dir:
+        try:
+            _chunk_cache = diskcache.Cache(os.path.join(os.path.expanduser(cache_dir), 'chunker'))
+        except Exception as e:
+            print(f"⚠️ Could not open chunk cache, continuing uncached: {e}")
+    return _chunk_cache
+
+
+def _stage_chunks(chunks: List[Dict[str, Any]]) -> str:
+    """Keep chunks in process memory and return a handle that refers to them."""
+    handle = f"{_STAGING_PREFIX}{uuid.uuid4().hex}"
+    with _STAGED_CHUNKS_LOCK:
+        _STAGED_CHUNKS[handle] = chunks
+        while len(_STAGED_CHUNKS) > _MAX_STAGED_CHUNKS:
+            evicted, _ = _STAGED_CHUNKS.popitem(last=False)
+            print(f"⚠️ Evicted unused staged chunks {evicted} (more than {_MAX_STAGED_CHUNKS} staged)")
+    return handle
+
+
+def _take_staged_chunks(handle: str) -> Optional[List[Dict[str, Any]]]:
+    """Remove and return the chunks staged under a handle, or None if it is unknown."""
+    with _STAGED_CHUNKS_LOCK:
+        return _STAGED_CHUNKS.pop(handle, None)
+
 
 class ApiContentOrchestratorAgent(Agent):
     def __init__(self):
         load_dotenv()
         
         # Load agent configuration - update to use manager config
-        agent_loader = AgentConfigLoader()
-        config_data = agent_loader.get_agent_config("api_orchestrator")
+        cfg = get_agent_cfg("api_orchestrator")
         
         # Setup LLM similar to existing agents
-        if "claude" in config_data.get("llm"):
-            from langchain_anthropic import ChatAnthropic
-            llm = ChatAnthropic(
-                model=config_data.get("llm"),
-                max_tokens=config_data.get("max_tokens"),
-                temperature=config_data.get("temperature"),
-                max_retries=config_data.get("max_retry_limit"),
-            )
-            print("Using Claude LLM for manager")
-        elif "gemini" in config_data.get("llm"):
-            google_api_key = os.getenv('GOOGLE_API_KEY')
-            if not google_api_key:
-                raise ValueError("GOOGLE_API_KEY environment variable is required for Gemini models")
-            
-            # Extract just the model name (remove the provider prefix)
-            model_name = config_data.get("llm").replace("gemini/", "")
-            
-            # Use CrewAI's LLM class for Gemini models
-            llm = LLM(
-                model=f"gemini/{model_name}",
-                api_key=google_api_key,
-                max_tokens=config_data.get("max_input_tokens"),
-                max_completion_tokens=config_data.get("max_output_tokens"),
-                temperature=config_data.get("temperature"),
-                reasoning_effort=config_data.get("reasoning_effort"),
-            )
-            print(f"Using Gemini LLM for manager: {model_name}")
-        else:
-            raise ValueError("Unsupported LLM type in configuration")
+        llm = build_llm(cfg, "manager")
         
         super().__init__(
-            role=config_data.get("role"),
-            goal=config_data.get("goal"),
-            backstory=config_data.get("backstory"),
+            role=cfg.role,
+            goal=cfg.goal,
+            backstory=cfg.backstory,
             llm=llm,
-            respect_context_window=config_data.get("respect_context_window"),
-            cache=config_data.get("cache"),
-            reasoning=config_data.get("reasoning"),
-            max_iter=config_data.get("max_iterations"),
-            max_retry_limit=config_data.get("max_retry_limit"),
-            verbose=config_data.get("verbose"),
-            tools=[self.chunk_discovery_results, self.coordinate_extraction]
+            tools=[self.chunk_discovery_results, self.coordinate_extraction],
+            **cfg.agent_kwargs()
         )
         
-        self._config_data = config_data
+        self._config_data = cfg
+        
+        warm_up_llm(llm)
 
     @tool("chunk_discovery_results")
-    def chunk_discovery_results(self, discovery_data: str, num_chunks: int = 3) -> List[Dict[str, Any]]:
+    def chunk_discovery_results(self, discovery_data: str, num_chunks: int = 3) -> str:
         """
         Split API discovery results into manageable chunks for parallel processing.
         
@@ -79,60 +190,62 @@ class ApiContentOrchestratorAgent(Agent):
             num_chunks: Number of chunks to create (default 3)
             
         Returns:
-            List of chunk dictionaries with endpoint data
+            Staging handle ("staging:<id>") to pass to coordinate_extraction once;
+            its result lists the endpoints of every chunk. Only the most recently
+            staged handles are kept. On failure, a JSON object with an 'error' key.
         """
         try:
-            data = json.loads(discovery_data) if isinstance(discovery_data, str) else discovery_data
-            
-            if not data or 'ocs' not in data:
-                return []
+            # Cache problems (unwritable directory, locked database, ...) only
+            # cost the memoization, never the chunking itself
+            cache = _get_chunk_cache() if isinstance(discovery_data, str) else None
+            if cache is not None:
+                try:
+                    key = f"v{_CHUNKER_VERSION}:{num_chunks}:{_content_hash(discovery_data.encode('utf-8')).hexdigest()}"
+                    chunks = cache.get(key)
+                    if chunks is not None:
+                        return _stage_chunks(chunks)
+                except Exception as e:
+                    print(f"⚠️ Chunk cache lookup failed, continuing uncached: {e}")
+                    cache = None
             
-            categories = data['ocs']
-            hostname = data.get('hostname', '')
+            data = loads(discovery_data) if isinstance(discovery_data, str) else discovery_data
+            chunks = _chunk_discovery_data(data, num_chunks)
             
-            # Calculate endpoints per chunk
-            total_endpoints = sum(len(cat.get('ces', [])) for cat in categories)
-            endpoints_per_chunk = max(1, total_endpoints // num_chunks)
+            if cache is not None:
+                try:
+                    cache.set(key, chunks, expire=_CHUNK_CACHE_TTL)
+                except Exception as e:
+                    print(f"⚠️ Could not store chunks in cache: {e}")
             
-            chunks = []
-            current_chunk = {'hostname': hostname, 'endpoints': []}
-            current_size = 0
-            
-            for category in categories:
-                for endpoint in category.get('ces', []):
-                    if current_size >= endpoints_per_chunk and len(chunks) < num_chunks - 1:
-                        chunks.append(current_chunk)
-                        current_chunk = {'hostname': hostname, 'endpoints': []}
-                        current_size = 0
-                    
-                    current_chunk['endpoints'].append({
-                        'category': category.get('name', ''),
-                        'endpoint': endpoint
-                    })
-                    current_size += 1
-            
-            if current_chunk['endpoints']:
-                chunks.append(current_chunk)
-            
-            return chunks
+            return _stage_chunks(chunks)
             
         except Exception as e:
             print(f"Error chunking data: {e}")
-            return []
+            return dumps({'error': f"Failed to chunk discovery results: {e}"})
     
     @tool("coordinate_extraction") 
-    def coordinate_extraction(self, chunks_data: str) -> Dict[str, Any]:
+    def coordinate_extraction(self, chunks_data: str) -> str:
         """
         Coordinate the parallel extraction of chunked endpoint data.
         
         Args:
-            chunks_data: JSON string of chunked endpoint data
+            chunks_data: Staging handle from chunk_discovery_results, or JSON string of chunked endpoint data
             
         Returns:
-            Coordination instructions for extraction agents
+            JSON string of coordination instructions for extraction agents,
+            including the endpoints assigned to each chunk
         """
         try:
-            chunks = json.loads(chunks_data) if isinstance(chunks_data, str) else chunks_data
+            if isinstance(chunks_data, str) and chunks_data.strip().startswith(_STAGING_PREFIX):
+                handle = chunks_data.strip()
+                chunks = _take_staged_chunks(handle)
+                if chunks is None:
+                    return dumps({
+                        'error': f"Unknown or expired staging handle: {handle}. "
+                                 "Call chunk_discovery_results again to get a new one."
+                    })
+            else:
+                chunks = loads(chunks_data) if isinstance(chunks_data, str) else chunks_data
             
             coordination_plan = {
                 'total_chunks': len(chunks),
@@ -145,12 +258,13 @@ class ApiContentOrchestratorAgent(Agent):
                     'chunk_id': i + 1,
                     'endpoints_count': len(chunk.get('endpoints', [])),
                     'hostname': chunk.get('hostname', ''),
+                    'endpoints': chunk.get('endpoints', []),
                     'processing_instructions': f"Process chunk {i+1} with {len(chunk.get('endpoints', []))} endpoints"
                 }
                 coordination_plan['chunk_assignments'].append(assignment)
             
-            return coordination_plan
+            return dumps(coordination_plan)
             
         except Exception as e:
             print(f"Error coordinating extraction: {e}")
-            return {'error': str(e)}
+            return dumps({'error': str(e)})
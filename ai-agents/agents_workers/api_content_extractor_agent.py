@@ -1,10 +1,14 @@
 import agentops
+import sys
 from dotenv import load_dotenv
-import os
-from crewai import Agent, LLM
-from crewai_tools import ScrapeWebsiteTool
-from langchain_anthropic import ChatAnthropic
-from core.agent_workers_config_loader import AgentConfigLoader
+from typing import Dict, Tuple
+from crewai import Agent
+from core.agent_workers_config_loader import get_agent_cfg
+from core.llm_factory import build_llm, warm_up_llm
+from tools.web_scraping import AsyncScrapeWebsiteTool
+
+# Formatted roles keyed by (role_template, chunk_id); one extractor agent is built per chunk
+_ROLE_CACHE: Dict[Tuple[str, int], str] = {}
 
 # @agentops.agent(name="api_link_content_extractor_agent")
 class ApiLinkContentExtractorAgent(Agent):
@@ -13,64 +17,37 @@ class ApiLinkContentExtractorAgent(Agent):
     def __init__(self, agent_id: int = 0):
         load_dotenv()
 
-        # Load configuration from centralized config file
-        agent_loader = AgentConfigLoader()
-        config_data = agent_loader.get_agent_config("api_link_content_extractor")
+        # Load configuration from the shared loader, which parses the config file once per process
+        cfg = get_agent_cfg("api_link_content_extractor")
 
-        if "claude" in config_data.get("llm"):
-            llm = ChatAnthropic(
-                model=config_data.get("llm"),
-                max_tokens=config_data.get("max_tokens"),
-                temperature=config_data.get("temperature"),
-                max_retries=config_data.get("max_retry_limit"),
-            )
-            print("Using Claude LLM for link content extraction")
-        elif "gemini" in config_data.get("llm"):
-            google_api_key = os.getenv('GOOGLE_API_KEY')
-            if not google_api_key:
-                raise ValueError("GOOGLE_API_KEY environment variable is required for Gemini models")
-            
-            # Extract just the model name (remove the provider prefix)
-            model_name = config_data.get("llm").replace("gemini/", "")
-            
-            # Use CrewAI's LLM class for Gemini models
-            llm = LLM(
-                model=f"gemini/{model_name}",
-                api_key=google_api_key,
-                max_tokens=config_data.get("max_input_tokens"),
-                max_completion_tokens=config_data.get("max_output_tokens"),
-                temperature=config_data.get("temperature"),
-                reasoning_effort=config_data.get("reasoning_effort"),
-            )
-            print(f"Using Gemini LLM for link content extraction: {model_name}")
-        else:
-            raise ValueError("Unsupported LLM type in configuration")
+        llm = build_llm(cfg, "link content extraction")
 
-        scraper_tool = ScrapeWebsiteTool()
+        # Fetches all of a chunk's pages concurrently over a process-wide connection pool
+        scraper_tool = AsyncScrapeWebsiteTool()
 
         chunk_id = agent_id
 
-        role_template = config_data.get("role")
+        role_template = cfg.role
         if not role_template:
             raise ValueError("No role found in task configuration")
         
-        role = role_template.format(chunk_id=chunk_id)
+        role = _ROLE_CACHE.get((role_template, chunk_id))
+        if role is None:
+            role = sys.intern(role_template.format(chunk_id=chunk_id))
+            _ROLE_CACHE[(role_template, chunk_id)] = role
         # Initialize the CrewAI Agent with the loaded configuration
         super().__init__(
             role=role,
-            goal=config_data.get("goal"),
-            backstory=config_data.get("backstory"),
+            goal=cfg.goal,
+            backstory=cfg.backstory,
             llm=llm,
             tools=[
                 scraper_tool
             ],
-            respect_context_window=config_data.get("respect_context_window"),
-            cache=config_data.get("cache"),
-            reasoning=config_data.get("reasoning"),
-            max_iter=config_data.get("max_iterations"),
-            max_retry_limit=config_data.get("max_retry_limit"),
-            verbose=config_data.get("verbose"),
+            **cfg.agent_kwargs()
         )
         
         # Store config data for later use
-        self._config_data = config_data
+        self._config_data = cfg
+        
+        warm_up_llm(llm)
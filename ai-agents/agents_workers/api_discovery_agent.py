@@ -14,8 +14,8 @@ from dotenv import load_dotenv
 import os
 from crewai import Agent, LLM
 from crewai_tools import ScrapeWebsiteTool
-from langchain_anthropic import ChatAnthropic
 from core.agent_workers_config_loader import AgentConfigLoader
+from core.llm_factory import load_chat_anthropic
 
 # @agentops.agent(name="api_link_discovery_agent")
 class ApiLinkDiscoveryAgent(Agent):
@@ -29,6 +29,7 @@ class ApiLinkDiscoveryAgent(Agent):
         config_data = agent_loader.get_agent_config("api_link_discovery")
 
         if "claude" in config_data.get("llm"):
+            ChatAnthropic = load_chat_anthropic()
             llm = ChatAnthropic(
                 model=config_data.get("llm"),
                 max_tokens=config_data.get("max_tokens"),
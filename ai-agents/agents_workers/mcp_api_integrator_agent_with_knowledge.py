@@ -6,32 +6,25 @@ Uses CrewAI Knowledge system to leverage MCP expertise for intelligent TypeScrip
 """
 
 from crewai import Agent, LLM
-from langchain_anthropic import ChatAnthropic
 from dotenv import load_dotenv
 import os
+import re
+import functools
 import json
 import time
+import atexit
+import hashlib
 import logging
-from datetime import datetime
-from typing import Dict, Any, List
+import logging.handlers
+import queue
+import tempfile
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
 from urllib.parse import urlparse
-from core.agent_workers_config_loader import get_agent_config
-
-# Set up file logging for debugging
-log_dir = "debug_logs"
-os.makedirs(log_dir, exist_ok=True)
-log_filename = f"{log_dir}/mcp_api_integrator_knowledge_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-# Configure logging with Windows-compatible settings
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_filename, mode='w', encoding='utf-8'),
-        logging.StreamHandler()
-    ],
-    force=True  # Override any existing logging configuration
-)
+from core.agent_workers_config_loader import get_agent_cfg
+from core.json_utils import dumps, loads
+from core.llm_factory import detect_provider, load_chat_anthropic
+from core.rate_limiter import get_rate_limiter, is_rate_limit_error
 
 # Set console output encoding to handle Unicode on Windows
 import sys
@@ -48,7 +41,116 @@ if sys.platform == "win32":
         pass
 
 logger = logging.getLogger(__name__)
-logger.info(f"Starting MCP API Integrator Agent with Knowledge debug logging - log file: {log_filename}")
+_logging_configured = False
+
+
+def _configure_logging() -> None:
+    """
+    Set up console logging, plus a debug log file when MCP_INTEGRATOR_LOG=DEBUG,
+    the first time an agent is created.
+    Deferred from import time so that importing this module (e.g. from the flow
+    or the UI) neither creates a log file nor replaces the logging configuration.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+    
+    debug = os.getenv('MCP_INTEGRATOR_LOG', 'INFO').upper() == 'DEBUG'
+    output_handlers = [logging.StreamHandler()]
+    
+    # Set up file logging for debugging
+    log_filename = None
+    if debug:
+        log_dir = "debug_logs"
+        os.makedirs(log_dir, exist_ok=True)
+        log_filename = f"{log_dir}/mcp_api_integrator_knowledge_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        output_handlers.append(logging.FileHandler(log_filename, mode='w', encoding='utf-8'))
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    for handler in output_handlers:
+        handler.setFormatter(formatter)
+    
+    # Records are formatted and written (and flushed) on a background thread,
+    # so debug logging does not block the agent on file and console I/O
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *output_handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Configure logging with Windows-compatible settings
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.INFO,
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        force=True  # Override any existing logging configuration
+    )
+    if log_filename:
+        logger.info("Starting MCP API Integrator Agent with Knowledge debug logging - log file: %s", log_filename)
+
+
+# Markdown sections the code generation response must contain
+_CODE_SECTIONS = ("Tools Implementation", "Resources Implementation")
+
+# Attempts at code generation before giving up on a response missing a section
+_MAX_GENERATION_ATTEMPTS = 3
+
+
+@functools.lru_cache(maxsize=None)
+def _section_regex(section_name: str, language: str) -> "re.Pattern[str]":
+    """Compiled regex matching a markdown section header followed by a code block in the given language."""
+    return re.compile(rf"#{{1,3}}\s*{re.escape(section_name)}.*?\n```{language}\n(.*?)\n```", re.DOTALL | re.IGNORECASE)
+
+
+def _write_text_file(path: str, content: str) -> None:
+    """Write a UTF-8 text file with raw os.write calls, skipping the buffered text I/O layer."""
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+class IntegrationCache:
+    """
+    Content-addressed on-disk cache of LLM code generation responses.
+    Entries are JSON files named by the SHA-256 of the model and prompt, so a rerun
+    with identical extraction results and settings skips the LLM call entirely.
+    """
+    
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Cache key for a prompt sent to a model."""
+        return hashlib.sha256(f"{model}\0{prompt}".encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss or unreadable entry."""
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.json"), 'rb') as f:
+                entry = loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        response = entry.get("response") if isinstance(entry, dict) else None
+        return response if isinstance(response, str) else None
+    
+    def put(self, key: str, response: str) -> None:
+        """Store a response, replacing the entry atomically so readers never see a partial file."""
+        entry = {"response": response, "created_at": datetime.now(timezone.utc).isoformat()}
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(dumps(entry))
+            os.replace(tmp_path, os.path.join(self.cache_dir, f"{key}.json"))
+        except OSError as error:
+            logger.warning("Could not write integration cache entry %s: %s", key, error)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
 
 class MCPAPIIntegratorAgentWithKnowledge(Agent):
@@ -58,21 +160,22 @@ class MCPAPIIntegratorAgentWithKnowledge(Agent):
     """
 
     def __init__(self, website_url: str = None, server_name: str = None, mcp_server_path: str = None, **kwargs):
-        logger.info(f"MCPAPIIntegratorAgentWithKnowledge.__init__ called with website_url={website_url}, server_name={server_name}, mcp_server_path={mcp_server_path}")
+        _configure_logging()
+        logger.info("MCPAPIIntegratorAgentWithKnowledge.__init__ called with website_url=%s, server_name=%s, mcp_server_path=%s", website_url, server_name, mcp_server_path)
         
         load_dotenv()
         
         # Set default values if not provided
         if website_url is None:
             website_url = "https://api.example.com"
-            logger.debug(f"Set default website_url: {website_url}")
+            logger.debug("Set default website_url: %s", website_url)
         
         # Generate server name from website URL if not provided
         if not server_name:
             parsed = urlparse(website_url)
             domain = parsed.netloc.replace('www.', '').replace('.', '-')
             server_name = f"{domain}-api-mcp-server"
-            logger.debug(f"Generated server_name: {server_name}")
+            logger.debug("Generated server_name: %s", server_name)
         
         # Use custom server path if provided, otherwise use default
         if mcp_server_path:
@@ -81,30 +184,31 @@ class MCPAPIIntegratorAgentWithKnowledge(Agent):
             else:
                 # Relative to current working directory
                 server_path = os.path.abspath(mcp_server_path)
-            logger.debug(f"Using custom server_path: {server_path}")
+            logger.debug("Using custom server_path: %s", server_path)
         else:
             # Default server path
             server_path = os.path.join(os.getcwd(), '..', 'mcp-servers', f"{server_name}")
-            logger.debug(f"Using default server_path: {server_path}")
+            logger.debug("Using default server_path: %s", server_path)
 
         # Validate server directory exists or can be created
-        logger.debug(f"Creating server directory: {server_path}")
+        logger.debug("Creating server directory: %s", server_path)
         os.makedirs(server_path, exist_ok=True)
 
         # Load agent configuration
         logger.info("Loading agent configuration...")
-        config = get_agent_config('mcp_api_integrator_agent')
+        config = get_agent_cfg('mcp_api_integrator_agent')
         
-        if config is None:
-            logger.error("Config is None!")
+        if config.name is None:
+            logger.error("No configuration found for 'mcp_api_integrator_agent'")
             raise ValueError("Could not load configuration for 'mcp_api_integrator_agent'. Check that the config file exists and is valid.")
         
         # Set up LLM
         llm_config = config.get("llm", "")
-        logger.debug(f"LLM config: {llm_config}")
+        logger.debug("LLM config: %s", llm_config)
         
         if "claude" in llm_config:
             logger.info("Setting up Claude LLM...")
+            ChatAnthropic = load_chat_anthropic()
             llm = ChatAnthropic(
                 model=config.get("llm", "claude-sonnet-4"),
                 max_tokens=config.get("max_output_tokens", 8000),
@@ -122,7 +226,7 @@ class MCPAPIIntegratorAgentWithKnowledge(Agent):
                 raise ValueError("GOOGLE_API_KEY environment variable is required for Gemini models")
             
             model_name = config.get("llm", "gemini-2.5-flash").replace("gemini/", "")
-            logger.debug(f"Extracted model name: {model_name}")
+            logger.debug("Extracted model name: %s", model_name)
             
             llm = LLM(
                 model=f"gemini/{model_name}",
@@ -134,9 +238,14 @@ class MCPAPIIntegratorAgentWithKnowledge(Agent):
             )
             logger.info("Gemini LLM configured successfully")
         else:
-            logger.error(f"Unsupported LLM type: {llm_config}")
+            logger.error("Unsupported LLM type: %s", llm_config)
             raise ValueError(f"Unsupported LLM type in configuration: {llm_config}")
         
+        use_batch_api = bool(config.get("use_batch_api", False))
+        if use_batch_api and "claude" not in llm_config:
+            logger.warning("use_batch_api is only supported for Claude models, using real-time calls")
+            use_batch_api = False
+        
         # Create MCP Knowledge Sources
         logger.info("Creating MCP Knowledge sources...")
         
@@ -155,16 +264,16 @@ class MCPAPIIntegratorAgentWithKnowledge(Agent):
         for filename in knowledge_files:
             full_path = os.path.join(knowledge_dir, filename)
             if os.path.exists(full_path):
-                logger.debug(f"Loading knowledge file: {full_path}")
+                logger.debug("Loading knowledge file: %s", full_path)
                 existing_files.append(filename)
             else:
-                logger.warning(f"Knowledge file not found: {full_path}")
+                logger.warning("Knowledge file not found: %s", full_path)
         
         if not existing_files:
-            logger.error(f"No knowledge files found in {knowledge_dir}")
+            logger.error("No knowledge files found in %s", knowledge_dir)
             raise ValueError(f"MCP knowledge files not found. Expected files: {knowledge_files}")
         
-        logger.info(f"Found {len(existing_files)} knowledge files")
+        logger.info("Found %d knowledge files", len(existing_files))
         
         # Create TextFileKnowledgeSource with the existing files
         from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
@@ -226,7 +335,7 @@ class MCPAPIIntegratorAgentWithKnowledge(Agent):
         # Add embedder configuration if available
         if embedder_config:
             init_kwargs['embedder'] = embedder_config
-            logger.info(f"Using embedder: {embedder_config['provider']}")
+            logger.info("Using embedder: %s", embedder_config['provider'])
         
         # Add any additional kwargs
         init_kwargs.update(kwargs)
@@ -239,29 +348,34 @@ class MCPAPIIntegratorAgentWithKnowledge(Agent):
         object.__setattr__(self, 'website_url', website_url)
         object.__setattr__(self, 'server_name', server_name)
         object.__setattr__(self, 'mcp_server_path', server_path)
+        object.__setattr__(self, '_tools_index_path', os.path.join(server_path, 'src', 'tools', 'index.ts'))
+        object.__setattr__(self, '_resources_index_path', os.path.join(server_path, 'src', 'resources', 'index.ts'))
         
         # Store workflow state
+        object.__setattr__(self, '_config_data', config)
+        object.__setattr__(self, '_use_batch_api', use_batch_api)
+        object.__setattr__(self, '_batch_poll_interval', float(os.getenv('MCP_INTEGRATOR_BATCH_POLL_INTERVAL', '60')))
+        object.__setattr__(self, '_batch_timeout', float(os.getenv('MCP_INTEGRATOR_BATCH_TIMEOUT', '86400')))
         object.__setattr__(self, '_extraction_results', None)
-        object.__setattr__(self, '_last_call_time', 0)
-        object.__setattr__(self, '_min_call_interval', float(os.getenv('MCP_INTEGRATOR_RATE_LIMIT', '2.0')))
         
-        logger.info(f"Agent initialization complete with MCP knowledge base!")
+        # Response cache is opt-in, since a hit replays earlier output instead of regenerating
+        cache_root = os.getenv('MCPEA_CACHE_DIR')
+        response_cache = IntegrationCache(os.path.join(os.path.expanduser(cache_root), 'integrator')) if cache_root else None
+        object.__setattr__(self, '_response_cache', response_cache)
+        rate_limiter = get_rate_limiter(detect_provider(llm_config), float(os.getenv('MCP_INTEGRATOR_RATE_LIMIT', '2.0')))
+        object.__setattr__(self, '_rate_limiter', rate_limiter)
+        
+        logger.info("Agent initialization complete with MCP knowledge base!")
     
     def _apply_rate_limiting(self):
-        """Apply rate limiting delay between LLM calls to prevent rate limit errors."""
-        current_time = time.time()
-        time_since_last_call = current_time - self._last_call_time
-        
-        if time_since_last_call < self._min_call_interval:
-            delay = self._min_call_interval - time_since_last_call
-            print(f"Rate limiting: waiting {delay:.1f}s before next API call")
-            time.sleep(delay)
-        
-        self._last_call_time = time.time()
+        """Wait for the provider's shared rate limiter before an LLM call."""
+        delay = self._rate_limiter.acquire()
+        if delay > 0:
+            logger.info("Rate limiting: waited %.1fs before API call", delay)
     
     def set_extraction_results(self, extraction_results: List[Dict[str, Any]]) -> None:
         """Set the extraction results for processing."""
-        logger.info(f"set_extraction_results called with {len(extraction_results)} results")
+        logger.info("set_extraction_results called with %d results", len(extraction_results))
         self._extraction_results = extraction_results
     
     def generate_mcp_tools_and_resources(self) -> str:
@@ -275,9 +389,6 @@ class MCPAPIIntegratorAgentWithKnowledge(Agent):
             logger.error("No extraction results available")
             return "Error: No extraction results available for processing"
         
-        # Apply rate limiting
-        self._apply_rate_limiting()
-        
         # Create a detailed prompt for the LLM with the extraction results
         prompt = f"""
 As an expert MCP (Model Context Protocol) TypeScript developer, analyze the following API extraction results and generate complete MCP server TypeScript code.
@@ -316,26 +427,118 @@ Provide the complete TypeScript code in two sections:
 Analyze the extracted API endpoints and create comprehensive, production-ready MCP tools and resources that follow all best practices from the knowledge base.
 """
 
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = IntegrationCache.make_key(self._config_data.get("llm", ""), prompt)
+            cached_response = self._response_cache.get(cache_key)
+            if cached_response is not None:
+                logger.info("Using cached MCP code generation response %s", cache_key)
+                return cached_response
+        
         try:
-            logger.info("Calling LLM for MCP code generation...")
-            
-            # Use the agent's LLM directly with the knowledge context
-            # The knowledge will be automatically retrieved based on the prompt
-            if hasattr(self.llm, 'invoke'):
-                response = self.llm.invoke(prompt)
-            elif hasattr(self.llm, 'predict'):
-                response = self.llm.predict(prompt)
-            else:
-                # Fallback for different LLM types
-                response = str(self.llm.generate([prompt]))
+            request_prompt = prompt
+            for attempt in range(1, _MAX_GENERATION_ATTEMPTS + 1):
+                # Apply rate limiting
+                self._apply_rate_limiting()
+                
+                logger.info("Calling LLM for MCP code generation (attempt %d)...", attempt)
+                try:
+                    response = self._call_llm(request_prompt)
+                except Exception as error:
+                    if not is_rate_limit_error(error) or attempt == _MAX_GENERATION_ATTEMPTS:
+                        raise
+                    self._rate_limiter.record_rate_limited()
+                    logger.warning("Rate limited by provider, retrying in %.1fs: %s", self._rate_limiter.interval, error)
+                    continue
+                self._rate_limiter.record_success()
+                
+                # Re-prompt with the specific problem instead of failing the whole
+                # integration when the response is missing a required section
+                response_text = getattr(response, 'content', response)
+                missing_sections = self._missing_code_sections(response_text) if isinstance(response_text, str) else []
+                if not missing_sections:
+                    break
+                
+                logger.warning("Generated code is missing sections %s (attempt %d/%d)", missing_sections, attempt, _MAX_GENERATION_ATTEMPTS)
+                if attempt < _MAX_GENERATION_ATTEMPTS:
+                    request_prompt = (
+                        f"{prompt}\n\n**Correction:** A previous answer to this request was missing the "
+                        f"{', '.join(missing_sections)} section(s). Provide both sections with the exact "
+                        f"headers and ```typescript code blocks shown in the output format."
+                    )
+                    time.sleep(2 ** (attempt - 1))
             
             logger.info("MCP code generation completed successfully")
+            
+            if cache_key is not None and isinstance(response_text, str) and not missing_sections:
+                self._response_cache.put(cache_key, response_text)
+            
             return response
             
         except Exception as error:
-            logger.error(f"Error in MCP code generation: {error}")
+            logger.error("Error in MCP code generation: %s", error)
             return f"Error generating MCP code: {str(error)}"
     
+    def _call_llm(self, prompt: str) -> Any:
+        """Send a prompt to the configured LLM and return its raw response."""
+        # Use the agent's LLM directly with the knowledge context
+        # The knowledge will be automatically retrieved based on the prompt
+        if self._use_batch_api:
+            return self._generate_via_batch_api(prompt)
+        if hasattr(self.llm, 'invoke'):
+            return self.llm.invoke(prompt)
+        if hasattr(self.llm, 'predict'):
+            return self.llm.predict(prompt)
+        # Fallback for different LLM types
+        return str(self.llm.generate([prompt]))
+    
+    def _missing_code_sections(self, content: str) -> List[str]:
+        """Names of the required code sections that a generated response lacks."""
+        return [
+            section for section in _CODE_SECTIONS
+            if not _section_regex(section, "typescript").search(content)
+        ]
+    
+    def _generate_via_batch_api(self, prompt: str) -> str:
+        """
+        Run a single prompt through the Anthropic Message Batches API.
+        Batch requests are billed at half the real-time price but can take up to
+        24 hours to complete, so this is only used when use_batch_api is enabled.
+        The batch is cancelled and TimeoutError raised if it has not ended within
+        MCP_INTEGRATOR_BATCH_TIMEOUT seconds (default 24 hours).
+        """
+        import anthropic
+        
+        client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        batch = client.messages.batches.create(requests=[{
+            "custom_id": "mcp-code-generation",
+            "params": {
+                "model": self._config_data.get("llm"),
+                "max_tokens": self._config_data.get("max_output_tokens", 8000),
+                "temperature": self._config_data.get("temperature", 0.2),
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        }])
+        logger.info("Submitted MCP code generation batch %s", batch.id)
+        
+        deadline = time.monotonic() + self._batch_timeout
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                try:
+                    client.messages.batches.cancel(batch.id)
+                except Exception as e:
+                    logger.warning("Failed to cancel timed out batch %s: %s", batch.id, e)
+                raise TimeoutError(f"Batch {batch.id} did not finish within {self._batch_timeout:.0f}s")
+            time.sleep(min(self._batch_poll_interval, max(0.0, deadline - time.monotonic())))
+            batch = client.messages.batches.retrieve(batch.id)
+        
+        for entry in client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                raise RuntimeError(f"Batch request {entry.custom_id} {entry.result.type}")
+            return "".join(block.text for block in entry.result.message.content if block.type == "text")
+        
+        raise RuntimeError(f"Batch {batch.id} returned no results")
+    
     def update_mcp_server_files(self, generated_code: str) -> Dict[str, Any]:
         """
         Update the actual MCP server files with the generated code.
@@ -356,48 +559,43 @@ Analyze the extracted API endpoints and create comprehensive, production-ready M
             
             # Update tools file
             if tools_code:
-                tools_file_path = os.path.join(self.mcp_server_path, 'src', 'tools', 'index.ts')
+                tools_file_path = self._tools_index_path
                 os.makedirs(os.path.dirname(tools_file_path), exist_ok=True)
                 
-                with open(tools_file_path, 'w', encoding='utf-8') as f:
-                    f.write(tools_code)
+                _write_text_file(tools_file_path, tools_code)
                 
-                logger.info(f"Updated tools file: {tools_file_path}")
+                logger.info("Updated tools file: %s", tools_file_path)
                 results["tools_updated"] = True
             else:
                 error_msg = "No tools code section found in generated response"
-                logger.error(f"{error_msg}")
+                logger.error(error_msg)
                 results["errors"].append(error_msg)
             
             # Update resources file  
             if resources_code:
-                resources_file_path = os.path.join(self.mcp_server_path, 'src', 'resources', 'index.ts')
+                resources_file_path = self._resources_index_path
                 os.makedirs(os.path.dirname(resources_file_path), exist_ok=True)
                 
-                with open(resources_file_path, 'w', encoding='utf-8') as f:
-                    f.write(resources_code)
+                _write_text_file(resources_file_path, resources_code)
                 
-                logger.info(f"Updated resources file: {resources_file_path}")
+                logger.info("Updated resources file: %s", resources_file_path)
                 results["resources_updated"] = True
             else:
                 error_msg = "No resources code section found in generated response"
-                logger.error(f"{error_msg}")
+                logger.error(error_msg)
                 results["errors"].append(error_msg)
                 
         except Exception as error:
             error_msg = f"Error updating MCP server files: {str(error)}"
-            logger.error(f"{error_msg}")
+            logger.error(error_msg)
             results["errors"].append(error_msg)
         
         return results
     
     def _extract_code_section(self, content: str, section_name: str, language: str) -> str:
         """Extract code from a markdown code block section."""
-        import re
-        
         # Look for section header followed by code block
-        pattern = rf"#{{{1,3}}}\s*{re.escape(section_name)}.*?\n```{language}\n(.*?)\n```"
-        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
+        match = _section_regex(section_name, language).search(content)
         
         if match:
             return match.group(1).strip()
@@ -452,7 +650,7 @@ Analyze the extracted API endpoints and create comprehensive, production-ready M
             
         except Exception as error:
             error_msg = f"Error in API integration workflow: {str(error)}"
-            logger.error(f"{error_msg}")
+            logger.error(error_msg)
             workflow_results["errors"].append(error_msg)
         
         return workflow_results
@@ -6,15 +6,118 @@ Creates the foundational TypeScript MCP server that can later be populated with
 """
 
 from crewai import Agent, LLM
-from crewai.tools import tool
-from langchain_anthropic import ChatAnthropic
+from crewai.tools import BaseTool
 from dotenv import load_dotenv
+from pydantic import BaseModel, Field
 import os
 import shutil
 import json
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple, Type
 from urllib.parse import urlparse
 from core.agent_workers_config_loader import get_agent_config
+from core.json_utils import dumps
+from core.llm_factory import load_chat_anthropic
+
+# Files every generated server must have at its root
+_REQUIRED_FILES = ('package.json', 'README.md', 'tsconfig.json')
+
+# Common main server file locations in templates, in order of preference,
+# as (subdirectory, filename) pairs
+_SERVER_FILE_CANDIDATES = (
+    ('src', 'index.ts'),
+    ('src', 'server.ts'),
+    ('src', 'main.ts'),
+    ('', 'index.ts'),
+    ('', 'server.ts'),
+)
+
+
+# (method name, tool description) for each generation step exposed as a tool
+_GENERATOR_STEPS = (
+    ("copy_template_structure", "Copy the MCP server template structure to the target directory."),
+    ("customize_package_json", "Customize the package.json with server-specific information."),
+    ("customize_readme", "Customize the README.md with server-specific information."),
+    ("customize_main_server_file", "Customize the main server TypeScript file with basic API configuration."),
+    ("validate_server_structure", "Validate that the generated server structure is complete and follows standards."),
+)
+
+
+class GeneratorStepInput(BaseModel):
+    """Input schema for GeneratorStepTool."""
+    context: str = Field(
+        default="{}",
+        description="Optional JSON context for the step. The agent's own settings are used."
+    )
+
+
+class GeneratorStepTool(BaseTool):
+    """Exposes one MCPBaseGeneratorAgent step method as a tool.
+
+    The args schema is declared once here, so building the tools for a new
+    agent does not re-run the @tool decorator's signature introspection.
+    """
+    args_schema: Type[BaseModel] = GeneratorStepInput
+    step: Callable[[Dict[str, Any]], Dict[str, Any]]
+
+    def _run(self, context: str = "{}") -> str:
+        return dumps(self.step({}))
+
+
+def _list_dir(path: str) -> Dict[str, bool]:
+    """Map the entries of a directory to whether they are directories.
+
+    The entry types come from the directory listing itself, so telling files
+    from directories costs no extra stat calls. Returns an empty dict if the
+    directory cannot be read.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        return {}
+
+
+def _has_file(entries: Dict[str, bool], name: str) -> bool:
+    """Whether a _list_dir result contains a non-directory entry with this name."""
+    return entries.get(name) is False
+
+
+def _parallel_copytree(src: str, dst: str, workers: int = 8) -> str:
+    """Copy a directory tree onto dst, copying the files on a thread pool.
+
+    Behaves like shutil.copytree(src, dst, dirs_exist_ok=True): directories are
+    created first, then the files are copied concurrently with shutil.copy2,
+    which copies in the kernel (sendfile) on Linux and releases the GIL while
+    doing so. The first failed copy is raised.
+    """
+    directories: List[Tuple[str, str]] = []
+    files: List[Tuple[str, str]] = []
+    pending = [(src, dst)]
+    while pending:
+        src_dir, dst_dir = pending.pop()
+        directories.append((src_dir, dst_dir))
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    pending.append((entry.path, target))
+                else:
+                    files.append((entry.path, target))
+
+    for _, dst_dir in directories:
+        os.makedirs(dst_dir, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume the results so a failed copy is raised here
+        for _ in executor.map(lambda pair: shutil.copy2(*pair), files):
+            pass
+
+    # Directory timestamps are copied last, as copytree does, so the file
+    # copies above do not overwrite them
+    for src_dir, dst_dir in directories:
+        shutil.copystat(src_dir, dst_dir)
+    return dst
 
 
 class MCPBaseGeneratorAgent(Agent):
@@ -26,11 +129,13 @@ class MCPBaseGeneratorAgent(Agent):
     def __init__(self, website_url: str, server_name: str = None, template_path: str = None, **kwargs):
         load_dotenv()
         
+        # Parse the website URL once; every customization step reuses the result
+        parsed_url = urlparse(website_url)
+        domain = parsed_url.netloc.replace('www.', '')
+        
         # Generate server name from website URL if not provided
         if not server_name:
-            parsed = urlparse(website_url)
-            domain = parsed.netloc.replace('www.', '').replace('.', '-')
-            server_name = f"{domain}-api-mcp-server"
+            server_name = f"{domain.replace('.', '-')}-api-mcp-server"
         
         # Use custom template path if provided, otherwise use default
         if template_path:
@@ -53,6 +158,7 @@ class MCPBaseGeneratorAgent(Agent):
         config = get_agent_config('mcp_base_generator_agent')
 
         if "claude" in config.get("llm"):
+            ChatAnthropic = load_chat_anthropic()
             llm = ChatAnthropic(
                 model=config.get("llm"),
                 max_tokens=config.get("max_output_tokens"),
@@ -104,41 +210,17 @@ class MCPBaseGeneratorAgent(Agent):
         object.__setattr__(self, 'server_name', server_name)
         object.__setattr__(self, 'template_dir', template_dir)
         object.__setattr__(self, 'output_dir', output_dir)
+        object.__setattr__(self, '_domain', domain)
+        object.__setattr__(self, '_base_url', f"{parsed_url.scheme}://{parsed_url.netloc}")
+        object.__setattr__(self, '_package_json_path', os.path.join(output_dir, 'package.json'))
+        object.__setattr__(self, '_readme_path', os.path.join(output_dir, 'README.md'))
+        object.__setattr__(self, '_src_dir', os.path.join(output_dir, 'src'))
         
-        # Create tools that have access to instance variables
-        @tool("copy_template_structure")
-        def copy_template_structure_tool(context: str = "{}") -> str:
-            """Copy the MCP server template structure to the target directory."""
-            return str(self.copy_template_structure({}))
-        
-        @tool("customize_package_json")  
-        def customize_package_json_tool(context: str = "{}") -> str:
-            """Customize the package.json with server-specific information."""
-            return str(self.customize_package_json({}))
-        
-        @tool("customize_readme")
-        def customize_readme_tool(context: str = "{}") -> str:
-            """Customize the README.md with server-specific information."""
-            return str(self.customize_readme({}))
-        
-        @tool("customize_main_server_file")
-        def customize_main_server_file_tool(context: str = "{}") -> str:
-            """Customize the main server TypeScript file with basic API configuration."""
-            return str(self.customize_main_server_file({}))
-        
-        @tool("validate_server_structure")
-        def validate_server_structure_tool(context: str = "{}") -> str:
-            """Validate that the generated server structure is complete and follows standards."""
-            return str(self.validate_server_structure({}))
-        
-        # Add tools to the agent
-        self.tools.extend([
-            copy_template_structure_tool,
-            customize_package_json_tool,
-            customize_readme_tool,
-            customize_main_server_file_tool,
-            validate_server_structure_tool
-        ])
+        # Expose the generation steps as tools bound to this agent
+        self.tools.extend(
+            GeneratorStepTool(name=name, description=description, step=getattr(self, name))
+            for name, description in _GENERATOR_STEPS
+        )
     
     def copy_template_structure(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -150,21 +232,25 @@ class MCPBaseGeneratorAgent(Agent):
         Returns:
             Dict with success status and details
         """
+        # Status lines are collected and written to stdout once at the end
+        messages = [
+            f"📁 Copying template from: {self.template_dir}",
+            f"📁 Target directory: {self.output_dir}"
+        ]
         try:
-            print(f"📁 Copying template from: {self.template_dir}")
-            print(f"📁 Target directory: {self.output_dir}")
-            
             # Create output directory if it doesn't exist
             os.makedirs(os.path.dirname(self.output_dir), exist_ok=True)
             
-            # Remove existing directory if it exists
+            # Overlay the template onto an existing server directory instead of
+            # deleting it first; template files are overwritten, and anything else
+            # (e.g. an installed node_modules) is kept
             if os.path.exists(self.output_dir):
-                print(f"⚠️ Removing existing server directory: {self.output_dir}")
-                shutil.rmtree(self.output_dir)
+                messages.append(f"⚠️ Updating existing server directory: {self.output_dir}")
             
             # Copy template structure
-            shutil.copytree(self.template_dir, self.output_dir)
-            print(f"✅ Template structure copied successfully")
+            _parallel_copytree(self.template_dir, self.output_dir)
+            messages.append("✅ Template structure copied successfully")
+            print("\n".join(messages))
             
             return {
                 "success": True,
@@ -175,7 +261,8 @@ class MCPBaseGeneratorAgent(Agent):
             
         except Exception as e:
             error_msg = f"Failed to copy template structure: {str(e)}"
-            print(f"❌ {error_msg}")
+            messages.append(f"❌ {error_msg}")
+            print("\n".join(messages))
             return {
                 "success": False,
                 "error": error_msg
@@ -192,7 +279,7 @@ class MCPBaseGeneratorAgent(Agent):
             Dict with success status and details
         """
         try:
-            package_json_path = os.path.join(self.output_dir, 'package.json')
+            package_json_path = self._package_json_path
             
             if not os.path.exists(package_json_path):
                 return {
@@ -204,9 +291,7 @@ class MCPBaseGeneratorAgent(Agent):
             with open(package_json_path, 'r', encoding='utf-8') as f:
                 package_data = json.load(f)
             
-            # Extract domain for better naming
-            parsed_url = urlparse(self.website_url)
-            domain = parsed_url.netloc.replace('www.', '')
+            domain = self._domain
             
             # Customize package.json
             package_data['name'] = self.server_name
@@ -258,7 +343,7 @@ class MCPBaseGeneratorAgent(Agent):
             Dict with success status and details
         """
         try:
-            readme_path = os.path.join(self.output_dir, 'README.md')
+            readme_path = self._readme_path
             
             if not os.path.exists(readme_path):
                 return {
@@ -266,9 +351,7 @@ class MCPBaseGeneratorAgent(Agent):
                     "error": "README.md not found in template"
                 }
             
-            # Extract domain info
-            parsed_url = urlparse(self.website_url)
-            domain = parsed_url.netloc.replace('www.', '')
+            domain = self._domain
             
             # Read existing README
             with open(readme_path, 'r', encoding='utf-8') as f:
@@ -316,31 +399,18 @@ class MCPBaseGeneratorAgent(Agent):
             Dict with success status and details
         """
         try:
-            # Common server file locations in templates
-            possible_paths = [
-                os.path.join(self.output_dir, 'src', 'index.ts'),
-                os.path.join(self.output_dir, 'src', 'server.ts'),
-                os.path.join(self.output_dir, 'src', 'main.ts'),
-                os.path.join(self.output_dir, 'index.ts'),
-                os.path.join(self.output_dir, 'server.ts')
-            ]
-            
-            server_file_path = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    server_file_path = path
-                    break
+            server_file = self._find_main_server_file()
             
-            if not server_file_path:
+            if not server_file:
                 return {
                     "success": False,
                     "error": "Main server file not found in template"
                 }
             
-            # Extract domain info
-            parsed_url = urlparse(self.website_url)
-            domain = parsed_url.netloc.replace('www.', '')
-            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+            server_file_path = os.path.join(self.output_dir, server_file)
+            
+            domain = self._domain
+            base_url = self._base_url
             
             # Read existing server file
             with open(server_file_path, 'r', encoding='utf-8') as f:
@@ -380,6 +450,39 @@ class MCPBaseGeneratorAgent(Agent):
                 "error": error_msg
             }
     
+    def _list_server_dirs(self) -> Dict[str, Dict[str, bool]]:
+        """
+        List the server root and src/ directories once each.
+        
+        src/ is only listed when the root listing shows it exists.
+        
+        Returns:
+            Dict mapping '' (the root) and 'src' to their _list_dir results
+        """
+        root_entries = _list_dir(self.output_dir)
+        src_entries = _list_dir(self._src_dir) if root_entries.get('src') else {}
+        return {'': root_entries, 'src': src_entries}
+    
+    def _find_main_server_file(self, listings: Optional[Dict[str, Dict[str, bool]]] = None) -> Optional[str]:
+        """
+        Locate the main server file in the generated server.
+        
+        Looks candidates up in directory listings instead of probing every
+        candidate path separately.
+        
+        Args:
+            listings: Result of _list_server_dirs, listed on demand if not given
+            
+        Returns:
+            Path of the main server file relative to the output directory, or None
+        """
+        if listings is None:
+            listings = self._list_server_dirs()
+        for subdir, filename in _SERVER_FILE_CANDIDATES:
+            if _has_file(listings[subdir], filename):
+                return f"{subdir}/{filename}" if subdir else filename
+        return None
+    
     def validate_server_structure(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate that the generated server structure is complete and follows standards.
@@ -391,55 +494,32 @@ class MCPBaseGeneratorAgent(Agent):
             Dict with validation results
         """
         try:
-            required_files = [
-                'package.json',
-                'README.md',
-                'tsconfig.json'
-            ]
+            # List the server root and src/ once and check everything against those
+            listings = self._list_server_dirs()
+            root_entries = listings['']
             
-            # Check for main server file
-            server_files = [
-                'src/index.ts',
-                'src/server.ts',
-                'src/main.ts',
-                'index.ts',
-                'server.ts'
-            ]
+            # Check required files
+            required_status = {file: _has_file(root_entries, file) for file in _REQUIRED_FILES}
+            missing_files = [file for file, exists in required_status.items() if not exists]
             
             validation_results = {
-                "required_files": {},
+                "required_files": required_status,
                 "server_file": None,
-                "structure_valid": True,
-                "missing_files": [],
+                "structure_valid": not missing_files,
+                "missing_files": missing_files,
                 "warnings": []
             }
             
-            # Check required files
-            for file in required_files:
-                file_path = os.path.join(self.output_dir, file)
-                exists = os.path.exists(file_path)
-                validation_results["required_files"][file] = exists
-                
-                if not exists:
-                    validation_results["missing_files"].append(file)
-                    validation_results["structure_valid"] = False
-            
             # Check for main server file
-            server_file_found = False
-            for file in server_files:
-                file_path = os.path.join(self.output_dir, file)
-                if os.path.exists(file_path):
-                    validation_results["server_file"] = file
-                    server_file_found = True
-                    break
-            
-            if not server_file_found:
+            server_file = self._find_main_server_file(listings)
+            if server_file:
+                validation_results["server_file"] = server_file
+            else:
                 validation_results["missing_files"].append("main server file (index.ts, server.ts, etc.)")
                 validation_results["structure_valid"] = False
             
             # Check for src directory structure
-            src_dir = os.path.join(self.output_dir, 'src')
-            if not os.path.exists(src_dir):
+            if not root_entries.get('src'):
                 validation_results["warnings"].append("No src directory found - using flat structure")
             
             if validation_results["structure_valid"]:
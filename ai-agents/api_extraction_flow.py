@@ -22,6 +22,7 @@ from tasks.mcp_base_generator_task import MCPBaseGeneratorTask
 from tasks.mcp_api_integration_task import MCPAPIIntegrationTask
 import json
 from typing import List, Dict, Any
+from core.json_utils import loads
 from models.api_flow_models import DiscoveryResult, ChunkData, ExtractionResult, MCPBaseGenerationResult
 import agentops
 from dotenv import load_dotenv
@@ -148,7 +149,7 @@ class ApiExtractionFlow(Flow):
                 print(f"🔍 DEBUG - Found data in first task json_dict: {type(discovery_data)}")
             elif hasattr(result, 'raw') and result.raw:
                 try:
-                    discovery_data = json.loads(result.raw)
+                    discovery_data = loads(result.raw)
                     print(f"🔍 DEBUG - Parsed data from raw: {type(discovery_data)}")
                 except json.JSONDecodeError:
                     print(f"🔍 DEBUG - Failed to parse raw result as JSON: {result.raw}")
@@ -161,7 +162,7 @@ class ApiExtractionFlow(Flow):
                 print(f"🔍 DEBUG - Using result as dict: {type(discovery_data)}")
             else:
                 try:
-                    discovery_data = json.loads(str(result))
+                    discovery_data = loads(str(result))
                     print(f"🔍 DEBUG - Parsed data from str: {type(discovery_data)}")
                 except json.JSONDecodeError:
                     print(f"🔍 DEBUG - Failed to parse result as JSON: {str(result)}")
@@ -238,7 +239,7 @@ class ApiExtractionFlow(Flow):
                     base_generation_data = result
                 else:
                     try:
-                        base_generation_data = json.loads(str(result))
+                        base_generation_data = loads(str(result))
                     except json.JSONDecodeError:
                         base_generation_data = None
             
@@ -503,7 +504,7 @@ class ApiExtractionFlow(Flow):
                 result_data = integration_result
             else:
                 try:
-                    result_data = json.loads(str(integration_result))
+                    result_data = loads(str(integration_result))
                 except:
                     result_data = {
                         "success": True,
@@ -566,7 +567,7 @@ class ApiExtractionFlow(Flow):
                 chunk_data = chunk_result
             else:
                 try:
-                    chunk_data = json.loads(str(chunk_result))
+                    chunk_data = loads(str(chunk_result))
                 except:
                     chunk_data = {"error": f"Could not parse chunk {chunk.chunk_id} result"}
 
@@ -0,0 +1,93 @@
+"""
+Agent Configuration Record
+
+Typed, immutable view of a single agent's entry in the agent YAML config files.
+Agents read settings as attributes instead of probing the raw config dict with
+repeated .get() calls.
+"""
+
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional
+
+# __slots__ via dataclass() is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# (config field, crewai.Agent keyword) pairs for the agent behaviour settings
+_AGENT_KWARG_FIELDS = (
+    ("respect_context_window", "respect_context_window"),
+    ("cache", "cache"),
+    ("reasoning", "reasoning"),
+    ("max_iterations", "max_iter"),
+    ("max_retry_limit", "max_retry_limit"),
+    ("verbose", "verbose"),
+    ("allow_delegation", "allow_delegation"),
+)
+
+
+@dataclass(frozen=True, **_SLOTS)
+class AgentConfig:
+    """Settings for one agent as loaded from configs/agent_*.yaml."""
+
+    name: Optional[str] = None
+    role: Optional[str] = None
+    goal: Optional[str] = None
+    backstory: Optional[str] = None
+    llm: Optional[str] = None
+    max_tokens: Optional[int] = None
+    max_input_tokens: Optional[int] = None
+    max_output_tokens: Optional[int] = None
+    temperature: Optional[float] = None
+    cache: Optional[bool] = None
+    respect_context_window: Optional[bool] = None
+    reasoning: Optional[bool] = None
+    reasoning_effort: Optional[str] = None
+    max_iterations: Optional[int] = None
+    max_retry_limit: Optional[int] = None
+    verbose: Optional[bool] = None
+    allow_delegation: Optional[bool] = None
+    use_batch_api: Optional[bool] = None
+
+    @classmethod
+    def from_dict(cls, config_data: Dict[str, Any]) -> "AgentConfig":
+        """Build a config record from a raw agent config dict, ignoring unknown keys.
+
+        Args:
+            config_data: Agent configuration dictionary
+
+        Returns:
+            AgentConfig instance
+        """
+        return cls(**{key: value for key, value in config_data.items() if key in _FIELD_NAMES})
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup of a setting, returning default when it is unset.
+
+        Args:
+            key: Config field name
+            default: Value returned when the setting is missing or None
+
+        Returns:
+            The configured value or default
+        """
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def agent_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for crewai.Agent built from the behaviour settings.
+
+        Unset settings are left out so the Agent model falls back to its own
+        defaults instead of validating an explicit None.
+
+        Returns:
+            Dictionary of Agent keyword arguments
+        """
+        kwargs = {}
+        for field_name, kwarg in _AGENT_KWARG_FIELDS:
+            value = getattr(self, field_name)
+            if value is not None:
+                kwargs[kwarg] = value
+        return kwargs
+
+
+_FIELD_NAMES = frozenset(field.name for field in fields(AgentConfig))
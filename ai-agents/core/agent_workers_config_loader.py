@@ -10,6 +10,7 @@ import os
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import logging
+from core.agent_config import AgentConfig
 
 logger = logging.getLogger(__name__)
 
@@ -30,10 +31,12 @@ class AgentConfigLoader:
         
         self.config_file_path = Path(config_file_path)
         self._config = None
+        self._agent_cfgs: Dict[str, AgentConfig] = {}
         self._load_config()
     
     def _load_config(self) -> None:
         """Load configuration from the YAML file."""
+        self._agent_cfgs.clear()
         try:
             if not self.config_file_path.exists():
                 logger.error(f"Config file not found: {self.config_file_path}")
@@ -80,6 +83,23 @@ class AgentConfigLoader:
         
         return merged_config
     
+    def get_agent_cfg(self, agent_name: str) -> AgentConfig:
+        """Get configuration for a specific agent as a typed record.
+        
+        The record is built once per agent and reused until the config is reloaded.
+        
+        Args:
+            agent_name: Name of the agent
+            
+        Returns:
+            AgentConfig record
+        """
+        agent_cfg = self._agent_cfgs.get(agent_name)
+        if agent_cfg is None:
+            agent_cfg = AgentConfig.from_dict(self.get_agent_config(agent_name))
+            self._agent_cfgs[agent_name] = agent_cfg
+        return agent_cfg
+    
     def get_all_agent_names(self) -> List[str]:
         """Get list of all configured agent names.
         
@@ -153,6 +173,7 @@ class AgentConfigLoader:
             
             # Update the configuration
             self._config[agent_name].update(config_updates)
+            self._agent_cfgs.pop(agent_name, None)
             
             # Save to file
             with open(self.config_file_path, 'w', encoding='utf-8') as f:
@@ -248,6 +269,17 @@ def get_agent_config(agent_name: str) -> Dict[str, Any]:
     """
     return get_config_loader().get_agent_config(agent_name)
 
+def get_agent_cfg(agent_name: str) -> AgentConfig:
+    """Convenience function to get an agent's configuration as a typed record.
+    
+    Args:
+        agent_name: Name of the agent
+        
+    Returns:
+        AgentConfig record
+    """
+    return get_config_loader().get_agent_cfg(agent_name)
+
 def reload_configs() -> None:
     """Convenience function to reload all configurations."""
     global _config_loader
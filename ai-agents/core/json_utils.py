@@ -0,0 +1,51 @@
+"""
+JSON Serialization Helpers
+
+Thin wrappers around orjson that fall back to the stdlib json module when
+orjson is not installed, so agents and tools can parse large payloads from
+upstream agents quickly without making orjson a hard dependency.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # stdlib-only environments
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from a str or bytes payload.
+
+    Args:
+        data: JSON text to parse
+
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: JSON-serializable Python object
+        pretty: Indent nested values by two spaces instead of emitting compact JSON
+
+    Both backends produce the same text: non-ASCII characters are emitted as-is
+    rather than escaped, compact output has no spaces after separators, and
+    non-str dict keys (int, float, bool, None) are converted to strings.
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,150 @@
+"""
+LLM Factory
+
+Builds the LLM client for an agent from its configuration. The provider is
+detected from the configured model name and dispatched through a table that is
+built once at import time, instead of re-running the provider if/elif chain in
+every agent constructor.
+"""
+
+import functools
+import os
+import threading
+from typing import Any, Callable, Dict, Set, Tuple
+from crewai import LLM
+from core.agent_config import AgentConfig
+
+
+@functools.lru_cache(maxsize=None)
+def load_chat_anthropic() -> type:
+    """Import langchain_anthropic's ChatAnthropic on first use.
+
+    The langchain/httpx import chain is only paid by processes that actually
+    run a Claude model; Gemini-only deployments never load it.
+    """
+    from langchain_anthropic import ChatAnthropic
+    return ChatAnthropic
+
+
+def _build_claude(cfg: AgentConfig, purpose: str) -> Any:
+    """Build a Claude chat model via langchain_anthropic."""
+    ChatAnthropic = load_chat_anthropic()
+
+    llm = ChatAnthropic(
+        model=cfg.llm,
+        max_tokens=cfg.max_tokens,
+        temperature=cfg.temperature,
+        max_retries=cfg.max_retry_limit,
+    )
+    print(f"Using Claude LLM for {purpose}")
+    return llm
+
+
+def _build_gemini(cfg: AgentConfig, purpose: str) -> Any:
+    """Build a Gemini model via CrewAI's LLM class."""
+    google_api_key = os.getenv('GOOGLE_API_KEY')
+    if not google_api_key:
+        raise ValueError("GOOGLE_API_KEY environment variable is required for Gemini models")
+
+    # Extract just the model name (remove the provider prefix)
+    model_name = cfg.llm.replace("gemini/", "")
+
+    llm = LLM(
+        model=f"gemini/{model_name}",
+        api_key=google_api_key,
+        max_tokens=cfg.max_input_tokens,
+        max_completion_tokens=cfg.max_output_tokens,
+        temperature=cfg.temperature,
+        reasoning_effort=cfg.reasoning_effort,
+    )
+    print(f"Using Gemini LLM for {purpose}: {model_name}")
+    return llm
+
+
+# (client type, model) pairs that already have a warm-up request in flight or
+# done, so agents sharing a model do not each send a billed warm-up request
+_WARMED: Set[Tuple[str, str]] = set()
+_WARMED_LOCK = threading.Lock()
+
+_LLM_BUILDERS: Dict[str, Callable[[AgentConfig, str], Any]] = {
+    "claude": _build_claude,
+    "gemini": _build_gemini,
+}
+
+
+def detect_provider(model: str) -> str:
+    """Detect the provider of a model name.
+
+    Args:
+        model: Configured model name, e.g. "gemini-2.5-flash" or "gemini/gemini-2.5-flash"
+
+    Returns:
+        Provider prefix of the model name, or the supported provider named
+        anywhere in it (e.g. "anthropic/claude-..." -> "claude")
+    """
+    if '/' in model:
+        prefix = model.split('/', 1)[0]
+    else:
+        prefix = model.split('-', 1)[0]
+    if prefix in _LLM_BUILDERS:
+        return prefix
+    
+    # Routed model names such as "vertex_ai/gemini-..." carry the provider
+    # after a gateway prefix
+    for provider in _LLM_BUILDERS:
+        if provider in model:
+            return provider
+    return prefix
+
+
+def build_llm(cfg: AgentConfig, purpose: str) -> Any:
+    """Build the LLM client described by an agent configuration.
+
+    Args:
+        cfg: Agent configuration record
+        purpose: Short description of the agent's job, used in log output
+
+    Returns:
+        LLM client for the configured provider
+    """
+    builder = _LLM_BUILDERS.get(detect_provider(cfg.llm or ""))
+    if builder is None:
+        raise ValueError("Unsupported LLM type in configuration")
+    return builder(cfg, purpose)
+
+
+def _send_warmup_request(llm: Any) -> None:
+    """Send a minimal prompt and discard the response."""
+    try:
+        if hasattr(llm, 'invoke'):
+            llm.invoke("ok")
+        else:
+            llm.call("ok")
+    except Exception as e:
+        print(f"LLM warm-up request failed: {e}")
+
+
+def warm_up_llm(llm: Any) -> None:
+    """Open the LLM client's connection in the background before its first real call.
+
+    Issues a tiny request on a daemon thread so the TLS handshake and connection
+    pool setup happen while the agent is still being wired into a crew. Each
+    client type and model is warmed at most once per process. Disabled unless
+    MCPEA_LLM_WARMUP is set, since the warm-up request is billed and counts
+    against rate limits.
+
+    Args:
+        llm: LLM client returned by build_llm
+    """
+    if os.getenv('MCPEA_LLM_WARMUP', '').lower() not in ('1', 'true', 'yes'):
+        return
+
+    model = getattr(llm, 'model', None) or getattr(llm, 'model_name', None)
+    if model:
+        key = (type(llm).__name__, str(model))
+        with _WARMED_LOCK:
+            if key in _WARMED:
+                return
+            _WARMED.add(key)
+
+    threading.Thread(target=_send_warmup_request, args=(llm,), name="llm-warmup", daemon=True).start()
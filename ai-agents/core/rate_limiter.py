@@ -0,0 +1,95 @@
+"""
+Adaptive LLM Rate Limiter
+
+Spaces out LLM calls per provider and adapts the spacing to the provider's
+rate limit responses, instead of sleeping for a fixed interval before every
+call. Limiters are shared process-wide, so agents calling the same provider
+draw from the same budget.
+"""
+
+import threading
+import time
+from typing import Dict
+
+
+class AdaptiveRateLimiter:
+    """Additive-increase/multiplicative-decrease limiter on the LLM request rate.
+
+    Every successful call shortens the interval between calls by a fixed step,
+    down to min_interval. Every rate limit error multiplies it by
+    backoff_factor, up to max_interval.
+    """
+
+    def __init__(self, interval: float, min_interval: float = 0.0, max_interval: float = 60.0,
+                 step: float = 0.25, backoff_factor: float = 2.0):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.step = step
+        self.backoff_factor = backoff_factor
+        self._interval = min(max(interval, min_interval), max_interval)
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def interval(self) -> float:
+        """Current spacing between calls in seconds."""
+        return self._interval
+
+    def acquire(self) -> float:
+        """Block until the next call may start.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot)
+            self._next_slot = start + self._interval
+
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def record_success(self) -> None:
+        """Shorten the interval after a call the provider accepted."""
+        with self._lock:
+            self._interval = max(self.min_interval, self._interval - self.step)
+
+    def record_rate_limited(self) -> None:
+        """Back off after the provider rejected a call for exceeding its rate limit."""
+        with self._lock:
+            self._interval = min(self.max_interval, max(self._interval, self.step) * self.backoff_factor)
+            self._next_slot = time.monotonic() + self._interval
+
+
+_LIMITERS: Dict[str, AdaptiveRateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(provider: str, interval: float) -> AdaptiveRateLimiter:
+    """Get the shared limiter for a provider, creating it on first use.
+
+    Args:
+        provider: Provider name, e.g. as returned by core.llm_factory.detect_provider
+        interval: Starting interval in seconds, used only when the limiter is created
+
+    Returns:
+        AdaptiveRateLimiter for the provider
+    """
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(provider)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(interval)
+            _LIMITERS[provider] = limiter
+        return limiter
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether an exception raised by an LLM client means the call was rate limited."""
+    if getattr(error, 'status_code', None) == 429:
+        return True
+    if 'RateLimit' in type(error).__name__:
+        return True
+    message = str(error).lower()
+    return 'rate limit' in message or 'rate_limit' in message
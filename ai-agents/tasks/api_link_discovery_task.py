@@ -8,6 +8,7 @@ from configs/tasks.yaml, similar to how agents load their configuration.
 import agentops
 from crewai import Task, TaskOutput
 from typing import Tuple, Any
+from core.json_utils import loads
 from core.task_config_loader import TaskConfigLoader
 from models.api_discovery_output import ApiLinkDiscoveryOutput
 
@@ -108,8 +109,7 @@ def validate_blog_content(result: TaskOutput) -> Tuple[bool, Any]:
     # Method 5: Try to parse if result is a string
     if not categories and isinstance(result, str):
         try:
-            import json
-            parsed = json.loads(result)
+            parsed = loads(result)
             print(f"🔍 DEBUG - Parsed string result: {type(parsed)} - {str(parsed)[:200]}")
             if isinstance(parsed, dict):
                 if 'cs' in parsed:
@@ -0,0 +1,46 @@
+"""
+Tests for core.agent_config.
+"""
+
+import dataclasses
+
+import pytest
+
+from core.agent_config import AgentConfig
+
+
+def test_from_dict_ignores_unknown_keys():
+    cfg = AgentConfig.from_dict({"name": "integrator", "llm": "claude-sonnet-4", "unknown_setting": 1})
+
+    assert cfg.name == "integrator"
+    assert cfg.llm == "claude-sonnet-4"
+    assert not hasattr(cfg, "unknown_setting")
+
+
+def test_unset_fields_default_to_none():
+    cfg = AgentConfig.from_dict({})
+
+    assert cfg.name is None
+    assert cfg.use_batch_api is None
+
+
+def test_get_returns_default_only_for_unset_values():
+    cfg = AgentConfig.from_dict({"temperature": 0.0, "verbose": False, "max_tokens": None})
+
+    assert cfg.get("temperature", 0.7) == 0.0
+    assert cfg.get("verbose", True) is False
+    assert cfg.get("max_tokens", 8000) == 8000
+    assert cfg.get("not_a_field", "fallback") == "fallback"
+
+
+def test_agent_kwargs_renames_fields_and_omits_unset_ones():
+    cfg = AgentConfig.from_dict({"max_iterations": 5, "verbose": False, "cache": None, "llm": "gemini-2.5-flash"})
+
+    assert cfg.agent_kwargs() == {"max_iter": 5, "verbose": False}
+
+
+def test_config_is_immutable():
+    cfg = AgentConfig.from_dict({"name": "integrator"})
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.name = "other"
@@ -0,0 +1,90 @@
+"""
+Tests for the discovery result chunking helpers of the API orchestrator agent.
+"""
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from agents_managers import api_orchestrator_agent as orchestrator
+
+
+def _discovery(sizes):
+    """Discovery payload with one category whose endpoints carry the given size hints."""
+    endpoints = []
+    for i, size in enumerate(sizes):
+        endpoint = {"name": f"endpoint_{i}"}
+        if size is not None:
+            endpoint["size"] = size
+        endpoints.append(endpoint)
+    return {"hostname": "api.example.com", "ocs": [{"name": "docs", "ces": endpoints}]}
+
+
+def _endpoint_names(chunks):
+    return sorted(entry["endpoint"]["name"] for chunk in chunks for entry in chunk["endpoints"])
+
+
+def test_numeric_sizes_balance_chunks_by_weight():
+    chunks = orchestrator._chunk_discovery_data(_discovery([9, 1, 1, 1, 1, 1, 1, 1, 1, 1]), 2)
+
+    loads = [sum(entry["endpoint"]["size"] for entry in chunk["endpoints"]) for chunk in chunks]
+    assert loads == [9, 9]
+
+
+@pytest.mark.parametrize("sizes", [
+    ["10kb", "12345", "1", "2"],
+    [10, "12345", 3, 4],
+    [10, None, 3, 4],
+    [10, True, 3, 4],
+    [10, -1, 3, 4],
+])
+def test_unusable_sizes_fall_back_to_equal_count_split(sizes):
+    data = _discovery(sizes)
+
+    chunks = orchestrator._chunk_discovery_data(data, 2)
+
+    assert [len(chunk["endpoints"]) for chunk in chunks] == [2, 2]
+    assert _endpoint_names(chunks) == sorted(f"endpoint_{i}" for i in range(len(sizes)))
+
+
+def test_fewer_endpoints_than_chunks_gives_one_endpoint_per_chunk():
+    chunks = orchestrator._chunk_discovery_data(_discovery([None, None]), 5)
+
+    assert [len(chunk["endpoints"]) for chunk in chunks] == [1, 1]
+
+
+def test_missing_categories_give_no_chunks():
+    assert orchestrator._chunk_discovery_data({"hostname": "api.example.com"}, 3) == []
+
+
+def test_lpt_puts_heaviest_chunk_first():
+    entries = [{"category": "docs", "endpoint": {"name": name}} for name in ("a", "b", "c")]
+
+    chunks = orchestrator._chunk_by_weight("api.example.com", entries, [1, 10, 1], 3)
+
+    assert [entry["endpoint"]["name"] for entry in chunks[0]["endpoints"]] == ["b"]
+    assert sorted(entry["endpoint"]["name"] for chunk in chunks[1:] for entry in chunk["endpoints"]) == ["a", "c"]
+
+
+@pytest.fixture
+def staging(monkeypatch):
+    """Empty staging area holding at most two chunk lists."""
+    monkeypatch.setattr(orchestrator, "_STAGED_CHUNKS", orchestrator.OrderedDict())
+    monkeypatch.setattr(orchestrator, "_MAX_STAGED_CHUNKS", 2)
+
+
+def test_staged_chunks_are_consumed_once(staging):
+    chunks = [{"hostname": "api.example.com", "endpoints": []}]
+    handle = orchestrator._stage_chunks(chunks)
+
+    assert handle.startswith(orchestrator._STAGING_PREFIX)
+    assert orchestrator._take_staged_chunks(handle) is chunks
+    assert orchestrator._take_staged_chunks(handle) is None
+
+
+def test_oldest_staged_chunks_are_evicted_beyond_the_limit(staging):
+    handles = [orchestrator._stage_chunks([{"hostname": str(i), "endpoints": []}]) for i in range(3)]
+
+    assert orchestrator._take_staged_chunks(handles[0]) is None
+    assert orchestrator._take_staged_chunks(handles[1])[0]["hostname"] == "1"
+    assert orchestrator._take_staged_chunks(handles[2])[0]["hostname"] == "2"
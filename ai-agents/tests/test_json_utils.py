@@ -0,0 +1,61 @@
+"""
+Tests for core.json_utils, with and without orjson installed.
+"""
+
+import json
+
+import pytest
+
+from core import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test once per serialization backend."""
+    if request.param == "orjson":
+        if json_utils.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    return request.param
+
+
+SAMPLES = [
+    {"name": "café ✓", "values": [1, 2.5, None, True, False]},
+    {"nested": {"empty_list": [], "empty_dict": {}}},
+    [],
+    "plain",
+]
+
+
+@pytest.mark.parametrize("obj", SAMPLES)
+@pytest.mark.parametrize("pretty", [False, True])
+def test_dumps_output_is_the_same_for_both_backends(obj, pretty, monkeypatch):
+    if json_utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    with_orjson = json_utils.dumps(obj, pretty=pretty)
+    monkeypatch.setattr(json_utils, "orjson", None)
+
+    assert json_utils.dumps(obj, pretty=pretty) == with_orjson
+
+
+def test_dumps_keeps_non_ascii_characters(backend):
+    assert json_utils.dumps({"name": "café"}) == '{"name":"café"}'
+
+
+def test_dumps_pretty_indents_by_two_spaces(backend):
+    assert json_utils.dumps({"a": [1]}, pretty=True) == '{\n  "a": [\n    1\n  ]\n}'
+
+
+def test_dumps_converts_non_str_keys(backend):
+    assert json_utils.loads(json_utils.dumps({1: "a", None: "b", False: "c"})) == {"1": "a", "null": "b", "false": "c"}
+
+
+@pytest.mark.parametrize("data", ['{"a": [1, "é"]}', b'{"a": [1, "\xc3\xa9"]}'])
+def test_loads_accepts_str_and_bytes(backend, data):
+    assert json_utils.loads(data) == {"a": [1, "é"]}
+
+
+def test_loads_raises_json_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads("{not json")
@@ -0,0 +1,115 @@
+"""
+Tests for core.rate_limiter.
+"""
+
+import pytest
+
+from core import rate_limiter
+from core.rate_limiter import AdaptiveRateLimiter, get_rate_limiter, is_rate_limit_error
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep so waits are recorded, not slept."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limiter.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_initial_interval_is_clamped_to_bounds():
+    assert AdaptiveRateLimiter(100.0, max_interval=60.0).interval == 60.0
+    assert AdaptiveRateLimiter(0.5, min_interval=1.0).interval == 1.0
+
+
+def test_acquire_spaces_calls_by_the_interval(clock):
+    limiter = AdaptiveRateLimiter(2.0)
+
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(2.0)
+    clock.now += 5.0
+    assert limiter.acquire() == 0
+    assert clock.sleeps == [pytest.approx(2.0)]
+
+
+def test_success_decreases_interval_additively_down_to_the_floor():
+    limiter = AdaptiveRateLimiter(1.0, min_interval=0.6, step=0.25)
+
+    limiter.record_success()
+    assert limiter.interval == pytest.approx(0.75)
+    limiter.record_success()
+    assert limiter.interval == pytest.approx(0.6)
+    limiter.record_success()
+    assert limiter.interval == pytest.approx(0.6)
+
+
+def test_rate_limit_increases_interval_multiplicatively_up_to_the_cap(clock):
+    limiter = AdaptiveRateLimiter(2.0, max_interval=5.0, backoff_factor=2.0)
+
+    limiter.record_rate_limited()
+    assert limiter.interval == pytest.approx(4.0)
+    limiter.record_rate_limited()
+    assert limiter.interval == pytest.approx(5.0)
+
+
+def test_rate_limit_from_zero_interval_backs_off_from_one_step(clock):
+    limiter = AdaptiveRateLimiter(0.0, step=0.25, backoff_factor=2.0)
+
+    limiter.record_rate_limited()
+
+    assert limiter.interval == pytest.approx(0.5)
+
+
+def test_rate_limit_delays_the_next_call(clock):
+    limiter = AdaptiveRateLimiter(1.0, backoff_factor=3.0)
+    limiter.acquire()
+
+    limiter.record_rate_limited()
+
+    assert limiter.acquire() == pytest.approx(3.0)
+
+
+def test_limiters_are_shared_per_provider(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "_LIMITERS", {})
+
+    claude = get_rate_limiter("claude", 2.0)
+
+    assert get_rate_limiter("claude", 9.0) is claude
+    assert claude.interval == 2.0
+    assert get_rate_limiter("gemini", 2.0) is not claude
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__("request failed")
+        self.status_code = status_code
+
+
+@pytest.mark.parametrize("error, expected", [
+    (StatusError(429), True),
+    (StatusError(500), False),
+    (RateLimitError("slow down"), True),
+    (Exception("Rate limit exceeded"), True),
+    (Exception("error type: rate_limit_error"), True),
+    (ValueError("bad prompt"), False),
+])
+def test_is_rate_limit_error(error, expected):
+    assert is_rate_limit_error(error) is expected
@@ -0,0 +1,53 @@
+"""
+Tests for the input schema formatting of the TypeScript generator tools.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from tools import typescript_generators
+
+
+def test_input_schema_round_trips_as_json():
+    properties = {"user_id": {"type": "number", "description": "Numeric id"}}
+
+    schema = typescript_generators._format_input_schema(properties, ["user_id"])
+
+    assert json.loads(schema) == {"type": "object", "properties": properties, "required": ["user_id"]}
+
+
+def test_input_schema_is_indented_under_the_input_schema_key():
+    schema = typescript_generators._format_input_schema({"q": {"type": "string", "description": ""}}, [])
+    lines = schema.split("\n")
+
+    assert lines[0] == "{"
+    assert lines[-1] == "    }"
+    assert all(line.startswith("      ") for line in lines[1:-1])
+
+
+def test_empty_input_schema_is_preformatted():
+    assert typescript_generators._EMPTY_INPUT_SCHEMA == typescript_generators._format_input_schema({}, [])
+    assert json.loads(typescript_generators._EMPTY_INPUT_SCHEMA) == {"type": "object", "properties": {}, "required": []}
+
+
+def test_tool_code_maps_parameter_types_into_the_schema():
+    endpoint = {
+        "method": "GET",
+        "path": "/users",
+        "description": "List users",
+        "parameters": [
+            {"name": "limit", "type": "integer", "description": "Page size", "required": True},
+            {"name": "active", "type": "bool", "description": "Only active users"},
+            {"name": "q", "description": "Search text"},
+        ],
+    }
+
+    code = typescript_generators.GenerateTypescriptToolTool()._run("list_users", endpoint)
+
+    assert '"limit": {\n          "type": "number"' in code
+    assert '"active": {\n          "type": "boolean"' in code
+    assert '"q": {\n          "type": "string"' in code
+    assert '"required": [\n        "limit"\n      ]' in code
@@ -1,10 +1,11 @@
 """
-Tools package for MCP API Integrator Agent
+Tools package for MC-PEA AI agents
 """
 
 from .file_operations import ReadFileTool, WriteFileTool, ListDirectoryTool
 from .typescript_generators import GenerateTypescriptToolTool, GenerateTypescriptResourceTool, ValidateTypescriptTool
 from .mcp_updaters import UpdateMCPToolsIndexTool, UpdateMCPResourcesIndexTool
+from .web_scraping import AsyncScrapeWebsiteTool
 
 __all__ = [
     'ReadFileTool',
@@ -14,5 +15,6 @@ __all__ = [
     'GenerateTypescriptResourceTool',
     'ValidateTypescriptTool',
     'UpdateMCPToolsIndexTool',
-    'UpdateMCPResourcesIndexTool'
+    'UpdateMCPResourcesIndexTool',
+    'AsyncScrapeWebsiteTool'
 ]
@@ -5,6 +5,7 @@ These tools handle basic file system operations like reading, writing, and listi
 """
 
 import os
+import functools
 import logging
 from typing import Type
 from pydantic import BaseModel, Field
@@ -13,6 +14,23 @@ from crewai.tools import BaseTool
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_from(cwd: str, path: str) -> str:
+    if os.path.isabs(path):
+        return path
+    return os.path.normpath(os.path.join(cwd, path))
+
+
+def resolve_path(path: str) -> str:
+    """Resolve a tool path argument to an absolute path.
+
+    Relative paths are taken from the current working directory. Results are
+    memoized per working directory, since agents pass the same handful of
+    server paths over and over.
+    """
+    return _resolve_from(os.getcwd(), path)
+
+
 class ReadFileInput(BaseModel):
     """Input schema for ReadFileTool."""
     file_path: str = Field(
@@ -41,14 +59,11 @@ class ReadFileTool(BaseTool):
         
         try:
             # Resolve the absolute path
-            if not os.path.isabs(file_path):
-                # Try relative to current working directory first
-                abs_path = os.path.abspath(file_path)
-                if not os.path.exists(abs_path):
-                    # Try relative to parent directory (common for mcp-servers)
-                    abs_path = os.path.abspath(os.path.join('..', file_path))
-            else:
-                abs_path = file_path
+            # Try relative to current working directory first
+            abs_path = resolve_path(file_path)
+            if not os.path.isabs(file_path) and not os.path.exists(abs_path):
+                # Try relative to parent directory (common for mcp-servers)
+                abs_path = resolve_path(os.path.join('..', file_path))
             
             logger.debug(f"📖 Resolved path: {abs_path}")
             
@@ -103,10 +118,7 @@ class WriteFileTool(BaseTool):
         
         try:
             # Resolve the absolute path
-            if not os.path.isabs(file_path):
-                abs_path = os.path.abspath(file_path)
-            else:
-                abs_path = file_path
+            abs_path = resolve_path(file_path)
                 
             logger.debug(f"✍️ Resolved path: {abs_path}")
             
@@ -158,10 +170,7 @@ class ListDirectoryTool(BaseTool):
         
         try:
             # Resolve the absolute path
-            if not os.path.isabs(dir_path):
-                abs_path = os.path.abspath(dir_path)
-            else:
-                abs_path = dir_path
+            abs_path = resolve_path(dir_path)
                 
             logger.debug(f"📂 Resolved path: {abs_path}")
             
@@ -171,20 +180,20 @@ class ListDirectoryTool(BaseTool):
             if not os.path.isdir(abs_path):
                 return f"Error: Path is not a directory: {abs_path}"
             
-            items = os.listdir(abs_path)
-            items.sort()
+            # scandir yields the entry type from the directory listing itself,
+            # so only regular files need a stat call for their size
+            with os.scandir(abs_path) as it:
+                items = sorted(it, key=lambda entry: entry.name)
             
             # Categorize items
             files = []
             directories = []
             
             for item in items:
-                item_path = os.path.join(abs_path, item)
-                if os.path.isdir(item_path):
-                    directories.append(f"📁 {item}/")
+                if item.is_dir():
+                    directories.append(f"📁 {item.name}/")
                 else:
-                    size = os.path.getsize(item_path)
-                    files.append(f"📄 {item} ({size} bytes)")
+                    files.append(f"📄 {item.name} ({item.stat().st_size} bytes)")
             
             result_lines = [f"Contents of {abs_path}:"]
             
@@ -4,25 +4,69 @@ TypeScript Code Generation Tools for MCP API Integrator Agent
 These tools generate TypeScript code for MCP tools and resources based on API endpoint data.
 """
 
+import hashlib
 import json
 import logging
+import os
 import subprocess
-from typing import Type, Dict, Any
+from typing import Type, Dict, Any, List, Optional, Union
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
+from core.json_utils import dumps, loads
+from .file_operations import resolve_path
 
 logger = logging.getLogger(__name__)
 
 
+def _tsc_build_info_path(abs_path: str) -> Optional[str]:
+    """Per-user location of the tsc build info for a validated file.
+
+    Kept across runs so re-validating a file only re-checks what changed since
+    the last validation. Lives under MCPEA_CACHE_DIR (default ~/.cache/mc-pea),
+    one file per source path, so runs for different servers never share one.
+    Returns None when the directory cannot be created (e.g. a read-only HOME).
+    """
+    cache_root = os.path.expanduser(os.getenv('MCPEA_CACHE_DIR') or os.path.join('~', '.cache', 'mc-pea'))
+    build_info_dir = os.path.join(cache_root, 'tsc')
+    try:
+        os.makedirs(build_info_dir, mode=0o700, exist_ok=True)
+    except OSError as e:
+        logger.debug(f"✅ No tsc build info directory, validating without --incremental: {e}")
+        return None
+    return os.path.join(build_info_dir, hashlib.sha256(abs_path.encode('utf-8')).hexdigest()[:16] + '.tsbuildinfo')
+
+
+# API parameter types that map to a JSON schema type other than 'string'
+_SCHEMA_TYPES = {
+    'integer': 'number',
+    'int': 'number',
+    'boolean': 'boolean',
+    'bool': 'boolean',
+}
+
+
+def _format_input_schema(properties: Dict[str, Any], required: List[str]) -> str:
+    """Serialize a tool input schema in one call, indented to sit under the tool definition's inputSchema key."""
+    input_schema = {
+        'type': 'object',
+        'properties': properties,
+        'required': required
+    }
+    return dumps(input_schema, pretty=True).replace('\n', '\n    ')
+
+
+_EMPTY_INPUT_SCHEMA = _format_input_schema({}, [])
+
+
 class GenerateTypescriptToolInput(BaseModel):
     """Input schema for GenerateTypescriptToolTool."""
     tool_name: str = Field(
         ..., 
         description="Name for the generated tool (e.g., 'get_user_profile', 'create_repository'). Should be snake_case."
     )
-    endpoint_data: str = Field(
+    endpoint_data: Union[str, Dict[str, Any]] = Field(
         ..., 
-        description="""JSON string containing API endpoint information with the following structure:
+        description="""JSON string (or object) containing API endpoint information with the following structure:
         {
             "method": "GET|POST|PUT|DELETE|PATCH",
             "path": "/api/v1/endpoint",
@@ -55,14 +99,14 @@ class GenerateTypescriptToolTool(BaseTool):
     """
     args_schema: Type[BaseModel] = GenerateTypescriptToolInput
 
-    def _run(self, tool_name: str, endpoint_data: str) -> str:
+    def _run(self, tool_name: str, endpoint_data: Union[str, Dict[str, Any]]) -> str:
         """Generate TypeScript code for an MCP tool."""
         logger.debug(f"⚙️ GenerateTypescriptToolTool._run called with tool_name={tool_name}")
         
         try:
-            # Parse endpoint data
+            # Parse endpoint data, unless it was passed as an object already
             try:
-                endpoint = json.loads(endpoint_data)
+                endpoint = endpoint_data if isinstance(endpoint_data, dict) else loads(endpoint_data)
             except json.JSONDecodeError as e:
                 return f"Error: Invalid JSON in endpoint_data: {str(e)}"
             
@@ -73,35 +117,23 @@ class GenerateTypescriptToolTool(BaseTool):
             
             logger.debug(f"⚙️ Parsed endpoint: method={method}, path={path}, {len(parameters)} parameters")
             
-            # Generate parameter schema
-            schema_properties = {}
-            required_params = []
-            
-            for param in parameters:
-                param_name = param.get('name', 'unknown')
-                param_type = param.get('type', 'string')
-                param_required = param.get('required', False)
-                param_description = param.get('description', '')
-                
-                # Map API parameter types to JSON schema types
-                if param_type in ['integer', 'int']:
-                    schema_type = 'number'
-                elif param_type in ['boolean', 'bool']:
-                    schema_type = 'boolean'
-                else:
-                    schema_type = 'string'
-                
-                schema_properties[param_name] = {
-                    'type': schema_type,
-                    'description': param_description
+            if parameters:
+                # Generate parameter schema
+                schema_properties = {
+                    param.get('name', 'unknown'): {
+                        'type': _SCHEMA_TYPES.get(param.get('type', 'string'), 'string'),
+                        'description': param.get('description', '')
+                    }
+                    for param in parameters
                 }
-                
-                if param_required:
-                    required_params.append(param_name)
+                required_params = [param.get('name', 'unknown') for param in parameters if param.get('required', False)]
+                input_schema_str = _format_input_schema(schema_properties, required_params)
+            else:
+                # Parameterless endpoints all share the same pre-serialized schema
+                schema_properties = {}
+                input_schema_str = _EMPTY_INPUT_SCHEMA
             
             # Generate the code
-            properties_str = json.dumps(schema_properties, indent=6)
-            required_str = json.dumps(required_params)
             param_names = list(schema_properties.keys())
             param_destructure = ', '.join(param_names) if param_names else ''
             
@@ -121,11 +153,7 @@ class GenerateTypescriptToolTool(BaseTool):
             tool_definition = f'''  {tool_name}: {{
     name: '{tool_name}',
     description: '{description}',
-    inputSchema: {{
-      type: 'object',
-      properties: {properties_str},
-      required: {required_str}
-    }}
+    inputSchema: {input_schema_str}
   }}'''
             
             # Generate tool handler
@@ -198,9 +226,9 @@ class GenerateTypescriptResourceInput(BaseModel):
         ..., 
         description="Name for the generated resource (e.g., 'user_profile', 'repository_list'). Should be snake_case."
     )
-    endpoint_data: str = Field(
+    endpoint_data: Union[str, Dict[str, Any]] = Field(
         ..., 
-        description="""JSON string containing API endpoint information with the following structure:
+        description="""JSON string (or object) containing API endpoint information with the following structure:
         {
             "method": "GET",
             "path": "/api/v1/resource",
@@ -228,14 +256,14 @@ class GenerateTypescriptResourceTool(BaseTool):
     """
     args_schema: Type[BaseModel] = GenerateTypescriptResourceInput
 
-    def _run(self, resource_name: str, endpoint_data: str) -> str:
+    def _run(self, resource_name: str, endpoint_data: Union[str, Dict[str, Any]]) -> str:
         """Generate TypeScript code for an MCP resource."""
         logger.debug(f"🔗 GenerateTypescriptResourceTool._run called with resource_name={resource_name}")
         
         try:
-            # Parse endpoint data
+            # Parse endpoint data, unless it was passed as an object already
             try:
-                endpoint = json.loads(endpoint_data)
+                endpoint = endpoint_data if isinstance(endpoint_data, dict) else loads(endpoint_data)
             except json.JSONDecodeError as e:
                 return f"Error: Invalid JSON in endpoint_data: {str(e)}"
             
@@ -343,19 +371,19 @@ class ValidateTypescriptTool(BaseTool):
         
         try:
             # Check if file exists
-            import os
-            if not os.path.isabs(file_path):
-                abs_path = os.path.abspath(file_path)
-            else:
-                abs_path = file_path
+            abs_path = resolve_path(file_path)
                 
             if not os.path.exists(abs_path):
                 return f"Error: File not found: {abs_path}"
             
             # Run TypeScript compiler to validate
             try:
+                command = ['tsc', '--noEmit']
+                build_info = _tsc_build_info_path(abs_path)
+                if build_info is not None:
+                    command += ['--incremental', '--tsBuildInfoFile', build_info]
                 result = subprocess.run(
-                    ['tsc', '--noEmit', abs_path],
+                    command + [abs_path],
                     capture_output=True,
                     text=True,
                     timeout=30
@@ -366,7 +394,7 @@ class ValidateTypescriptTool(BaseTool):
                     return f"TypeScript validation passed for {file_path} ✅"
                 else:
                     logger.debug(f"✅ TypeScript validation failed for {abs_path}")
-                    return f"TypeScript validation failed for {file_path}:\n\n{result.stderr}"
+                    return f"TypeScript validation failed for {file_path}:\n\n{result.stdout}{result.stderr}"
                     
             except subprocess.TimeoutExpired:
                 return f"TypeScript validation timed out for {file_path}"
@@ -0,0 +1,120 @@
+"""
+Web Scraping Tools for API Content Extractor Agents
+
+These tools fetch API documentation pages concurrently over a connection pool that
+is shared by every extractor agent in the process.
+"""
+
+import asyncio
+import logging
+import re
+import threading
+from typing import Type, List, ClassVar, Optional, Tuple
+import aiohttp
+from bs4 import BeautifulSoup
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool
+
+logger = logging.getLogger(__name__)
+
+# Whitespace normalization applied to every scraped page
+_INLINE_WHITESPACE = re.compile("[ \t]+")
+_BLANK_LINES = re.compile("\\s+\n\\s+")
+
+
+class AsyncScrapeWebsiteInput(BaseModel):
+    """Input schema for AsyncScrapeWebsiteTool."""
+    urls: List[str] = Field(
+        ...,
+        description="Full URLs of the documentation pages to read. Pass every URL you need in a single call."
+    )
+
+
+class AsyncScrapeWebsiteTool(BaseTool):
+    name: str = "scrape_websites"
+    description: str = """
+    Read the text content of one or more documentation pages in a single call.
+
+    Pages are fetched concurrently, so pass all of the URLs you need at once rather
+    than calling this tool once per URL. The content of each page is returned in
+    the same order as the requested URLs.
+    """
+    args_schema: Type[BaseModel] = AsyncScrapeWebsiteInput
+    max_concurrency: int = 16
+    request_timeout: float = 30.0
+    # Upper bound on the text returned per page, so one call over many pages
+    # cannot produce an unbounded tool result
+    max_page_chars: int = 20000
+
+    # One event loop and session per process so every pooled agent shares the
+    # same keep-alive connections and DNS cache.
+    _loop: ClassVar[Optional[asyncio.AbstractEventLoop]] = None
+    _session: ClassVar[Optional[aiohttp.ClientSession]] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Start the shared event loop and client session on first use."""
+        with cls._lock:
+            if cls._session is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="scrape-websites", daemon=True).start()
+                cls._session = asyncio.run_coroutine_threadsafe(cls._create_session(), loop).result()
+                cls._loop = loop
+        return cls._session
+
+    @staticmethod
+    async def _create_session() -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": "Mozilla/5.0 (compatible; MC-PEA API extractor)"},
+        )
+
+    def _run(self, urls: List[str]) -> str:
+        """Fetch all URLs concurrently and return their text content."""
+        logger.debug(f"🌐 AsyncScrapeWebsiteTool._run called with {len(urls)} urls")
+
+        session = self._get_session()
+        future = asyncio.run_coroutine_threadsafe(self._scrape_all(session, urls), self._loop)
+        responses = future.result()
+
+        # HTML is parsed here in the calling thread, not on the shared event
+        # loop, so parsing never stalls the fetches of other agents
+        pages = [
+            self._extract_text(url, html) if error is None else error
+            for url, html, error in responses
+        ]
+        return "\n\n".join(pages)
+
+    async def _scrape_all(self, session: aiohttp.ClientSession, urls: List[str]) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(*[self._fetch(session, semaphore, url) for url in urls])
+
+    async def _fetch(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """Fetch one page, returning (url, html, None) or (url, None, error message)."""
+        async with semaphore:
+            try:
+                timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+                async with session.get(url, timeout=timeout) as response:
+                    response.raise_for_status()
+                    html = await response.text()
+            except Exception as e:
+                error_msg = f"Error scraping {url}: {str(e)}"
+                logger.error(f"🌐 {error_msg}")
+                return url, None, error_msg
+
+        return url, html, None
+
+    def _extract_text(self, url: str, html: str) -> str:
+        """Convert a fetched page to normalized, length-capped text."""
+        text = BeautifulSoup(html, "html.parser").get_text(" ")
+        text = _INLINE_WHITESPACE.sub(" ", text)
+        text = _BLANK_LINES.sub("\n", text)
+
+        if len(text) > self.max_page_chars:
+            logger.debug(f"🌐 Truncating {len(text)} characters from {url} to {self.max_page_chars}")
+            text = f"{text[:self.max_page_chars]}\n[... truncated {len(text) - self.max_page_chars} characters]"
+
+        logger.debug(f"🌐 Scraped {len(text)} characters from {url}")
+        return f"Content of {url}:\n{text}"